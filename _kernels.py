@@ -0,0 +1,127 @@
+# Jądra numeryczne dla pierwszykrokmilowy.py (kompilowane przez Numba)
+#
+# Moduł importowany jest dopiero przy pierwszym wywołaniu funkcji skalarnych
+# (calculate_ground_coverage, calculate_sso_orbit_parameters,
+# calculate_imaging_intervals). Główny skrypt liczy scenariusze wsadowo w NumPy,
+# więc nie płaci za import Numby ani za kompilację/wczytanie jąder z cache.
+# Stałe przekazywane są jawnie jako argumenty - moduł nie zależy od skryptu.
+
+from math import ceil, radians, tan, tau
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba jest opcjonalna - bez niej jądra obliczeniowe działają jako zwykły Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+@njit('UniTuple(float64, 4)(float64, float64, float64, float64, float64)', cache=True)
+def ground_coverage_core(altitude, fov_degrees, sensor_width_mm, sensor_height_mm, pixel_size_um):
+    """
+    Jądro numeryczne dla calculate_ground_coverage (kompilowane przez Numba przy
+    imporcie tego modułu dzięki jawnej sygnaturze, tj. przy pierwszym wywołaniu
+    calculate_ground_coverage - kompilacja lub wczytanie z cache wliczają się w to wywołanie).
+    
+    Zwraca:
+    tuple: (szerokość pokrycia w m, wysokość pokrycia w m, szerokość w px, wysokość w px) jako float
+    """
+    fov_rad = radians(fov_degrees)
+    swath_width = 2 * altitude * tan(fov_rad / 2)
+    
+    # Proporcja sensora
+    aspect_ratio = sensor_width_mm / sensor_height_mm
+    
+    # Obliczamy wysokość pokrycia (w kierunku lotu)
+    swath_height = swath_width / aspect_ratio
+    
+    # Obliczamy rozdzielczość w pikselach. Dzielenie celowo nie jest zastąpione
+    # mnożeniem przez wspólne 1000 / pixel_size_um - inne zaokrąglenie potrafi
+    # zmienić wynik int() (np. 4999 zamiast 5000 pikseli)
+    width_px = int(sensor_width_mm * 1000 / pixel_size_um)
+    height_px = int(sensor_height_mm * 1000 / pixel_size_um)
+    
+    return (swath_width, swath_height, float(width_px), float(height_px))
+
+@njit(cache=True)
+def sso_orbit_core(orbital_radius, orbital_period_seconds, seconds_per_minute, seconds_per_day):
+    """
+    Jądro numeryczne dla calculate_sso_orbit_parameters (kompilowane przez Numba).
+    
+    Zwraca:
+    tuple: (promień orbity w km, okres w minutach, orbity na dzień,
+            cykl powtórzeń w dniach, separacja orbit w stopniach)
+    """
+    orbital_period_minutes = orbital_period_seconds / seconds_per_minute
+    
+    # Liczba orbit na dzień
+    orbits_per_day = seconds_per_day / orbital_period_seconds
+    
+    # Rozdzielczość czasowa powtórzeń (rewizyt) dla danego obszaru
+    # Satellite ground track repeat cycle
+    repeat_cycle_days = float(ceil(orbits_per_day))  # zaokrąglenie w górę do pełnego dnia
+    
+    # Obliczenie kąta separacji między kolejnymi orbitami na równiku
+    longitude_separation_degrees = 360 / orbits_per_day
+    
+    return (
+        orbital_radius / 1000,
+        orbital_period_minutes,
+        orbits_per_day,
+        repeat_cycle_days,
+        longitude_separation_degrees
+    )
+
+@njit(cache=True, fastmath=True)
+def imaging_intervals_core(orbital_radius, orbital_period_seconds, swath_width, swath_height,
+                           overlap_factor, earth_radius, earth_circumference, seconds_per_hour):
+    """
+    Jądro numeryczne dla calculate_imaging_intervals (kompilowane przez Numba).
+    
+    Zwraca:
+    tuple: 9 wartości w kolejności pól ImagingIntervals
+    """
+    # Obliczenia dla pokrycia wzdłuż toru lotu (along-track)
+    effective_height = swath_height * overlap_factor
+    
+    # Obliczenie prędkości naziemnej satelity
+    orbital_circumference = tau * orbital_radius  # obwód orbity w metrach
+    satellite_velocity = orbital_circumference / orbital_period_seconds  # m/s
+    ground_velocity = satellite_velocity * (earth_radius / orbital_radius)  # m/s
+    
+    # Obliczenie co ile sekund należy wykonać zdjęcie wzdłuż toru lotu
+    time_interval_seconds = effective_height / ground_velocity
+    
+    # Obliczenie co ile metrów należy wykonać zdjęcie wzdłuż toru lotu
+    distance_interval_along_track = effective_height
+    
+    # Obliczenia dla pokrycia w poprzek toru lotu (cross-track)
+    effective_width = swath_width * overlap_factor
+    
+    # Ile pasów potrzeba, aby pokryć cały równik
+    num_strips_equator = float(ceil(earth_circumference / effective_width))
+    
+    # Co ile stopni długości geograficznej powinien przechodzić tor orbity
+    longitude_interval_degrees = 360 / num_strips_equator
+    
+    # Co ile metrów na równiku należy wykonać pas zdjęć
+    distance_interval_cross_track = earth_circumference / num_strips_equator
+    
+    # Ile orbit potrzeba, aby pokryć całą Ziemię
+    num_orbits_for_coverage = num_strips_equator / 2  # Zakładając orbitę polarną
+    
+    # Ile czasu zajmie pełne pokrycie Ziemi (w godzinach)
+    time_for_full_coverage_hours = (num_orbits_for_coverage * orbital_period_seconds) / seconds_per_hour
+    
+    return (
+        satellite_velocity * 3.6,  # km/h
+        ground_velocity * 3.6,  # km/h
+        time_interval_seconds,
+        distance_interval_along_track / 1000,
+        distance_interval_cross_track / 1000,
+        longitude_interval_degrees,
+        num_strips_equator,
+        num_orbits_for_coverage,
+        time_for_full_coverage_hours
+    )
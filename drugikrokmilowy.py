@@ -1,12 +1,36 @@
 # Kamien Milowy 2: Adaptacja i optymalizacja obrazowania
 
+import os
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
+from math import ceil
+
+# Ustawienia zapisu prostych wykresów (kilka słupków/linii - wysokie DPI tylko spowalnia rasteryzację)
+SAVEFIG_KW = dict(dpi=100, bbox_inches='tight')
+
+# Bez ekranu (Linux bez DISPLAY/WAYLAND_DISPLAY) lub z wymuszonym Agg nie otwieramy okien wykresów
+INTERACTIVE = (os.environ.get('MPLBACKEND', '').lower() != 'agg'
+               and (not sys.platform.startswith('linux')
+                    or bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))))
 
 # Funkcje pomocnicze
 
+# matplotlib importowany dopiero przy pierwszym wykresie - sam import trwa kilkaset ms
+def _pyplot():
+    import matplotlib as mpl
+    if not INTERACTIVE:
+        mpl.use('Agg')
+    import matplotlib.pyplot as plt
+
+    # Upraszczanie ścieżek i dzielenie długich linii na fragmenty w backendzie Agg
+    mpl.rcParams['path.simplify'] = True
+    mpl.rcParams['path.simplify_threshold'] = 1.0
+    mpl.rcParams['agg.path.chunksize'] = 10000
+    return plt
+
 def adjust_acquisition_frequency(original_num_images, orbit_frequency_factor=1):
-    return int(np.ceil(original_num_images / orbit_frequency_factor))
+    return ceil(original_num_images / orbit_frequency_factor)
 
 def simulate_hybrid_acquisition_with_terrain_and_daylight(high_res_data_gb, low_res_data_gb,
                                                            urban_area_percent=10, other_land_area_percent=30,
@@ -25,29 +49,42 @@ def check_transmission_limit(data_volume_gb, daily_limit_gb):
     return data_volume_gb <= daily_limit_gb
 
 def plot_compression_effects(original_data_gb, compression_ratios):
-    compressed_data = [original_data_gb / ratio for ratio in compression_ratios]
+    plt = _pyplot()
+
+    ratios = np.asarray(compression_ratios, dtype=np.float64)
+    compressed_data = original_data_gb / ratios
 
-    plt.figure(figsize=(8,6))
-    plt.plot(compression_ratios, compressed_data, marker='o')
+    fig = plt.figure(figsize=(8,6))
+    plt.plot(ratios, compressed_data, marker='o')
     plt.xlabel('Współczynnik kompresji (np. 2 = 2:1)')
     plt.ylabel('Objętość danych po kompresji [GB]')
     plt.title('Wpływ kompresji na objętość danych')
     plt.grid(True)
-    plt.savefig('compression_effects.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    plt.savefig('compression_effects.png', **SAVEFIG_KW)
+    if INTERACTIVE:
+        plt.show()
+    else:
+        plt.close(fig)
+    return fig
 
 def plot_scenarios(scenarios, volumes_gb):
-    plt.figure(figsize=(10,6))
+    plt = _pyplot()
+
+    volumes_gb = np.asarray(volumes_gb, dtype=np.float64)
+
+    fig = plt.figure(figsize=(10,6))
     bars = plt.bar(scenarios, volumes_gb)
     plt.ylabel('Objętość danych [GB]')
     plt.title('Porównanie objętości danych dla różnych wariantów')
     plt.grid(axis='y', linestyle='--', alpha=0.7)
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height + 1, f'{height:.1f} GB', ha='center', va='bottom', fontweight='bold')
+    plt.gca().bar_label(bars, fmt='%.1f GB', padding=3, fontweight='bold')
     plt.tight_layout()
-    plt.savefig('scenarios_comparison.png', dpi=300, bbox_inches='tight')
-    plt.show()
+    plt.savefig('scenarios_comparison.png', **SAVEFIG_KW)
+    if INTERACTIVE:
+        plt.show()
+    else:
+        plt.close(fig)
+    return fig
 
 # Główna symulacja
 
@@ -77,45 +114,20 @@ def main():
     high_res_full_data_gb = gb_per_day_500km
     low_res_full_data_gb = gb_per_day_700km
 
-    # Warianty
-    min_data_gb = simulate_hybrid_acquisition_with_terrain_and_daylight(
-        high_res_data_gb=0,
-        low_res_data_gb=low_res_full_data_gb,
-        urban_area_percent=0,
-        other_land_area_percent=30,
-        ocean_area_percent=70,
-        compression_ratio_high_res=2,
-        compression_ratio_low_res=20,
-        daylight_fraction=0.5
-    )
-    min_data_gb = adjust_acquisition_frequency(min_data_gb, orbit_frequency_factor=5)
-
-    careful_data_gb = simulate_hybrid_acquisition_with_terrain_and_daylight(
-        high_res_data_gb=high_res_full_data_gb,
-        low_res_data_gb=low_res_full_data_gb,
-        urban_area_percent=5,
-        other_land_area_percent=30,
-        ocean_area_percent=65,
-        compression_ratio_high_res=5,
-        compression_ratio_low_res=10,
-        daylight_fraction=0.5
-    )
-    careful_data_gb = adjust_acquisition_frequency(careful_data_gb, orbit_frequency_factor=4)
-
-    balanced_data_gb = simulate_hybrid_acquisition_with_terrain_and_daylight(
-        high_res_data_gb=high_res_full_data_gb,
+    # Warianty: Minimalny, Ostrożny, Zrównoważony - liczone jednym wywołaniem na tablicach
+    scenarios = ['Minimalny', 'Ostrożny', 'Zrównoważony']
+    data_gb = simulate_hybrid_acquisition_with_terrain_and_daylight(
+        high_res_data_gb=np.array([0, high_res_full_data_gb, high_res_full_data_gb]),
         low_res_data_gb=low_res_full_data_gb,
-        urban_area_percent=10,
+        urban_area_percent=np.array([0, 5, 10]),
         other_land_area_percent=30,
-        ocean_area_percent=60,
-        compression_ratio_high_res=2,
-        compression_ratio_low_res=4,
+        ocean_area_percent=np.array([70, 65, 60]),
+        compression_ratio_high_res=np.array([2, 5, 2]),
+        compression_ratio_low_res=np.array([20, 10, 4]),
         daylight_fraction=0.5
     )
-    balanced_data_gb = adjust_acquisition_frequency(balanced_data_gb, orbit_frequency_factor=3)
-
-    scenarios = ['Minimalny', 'Ostrożny', 'Zrównoważony']
-    volumes = [min_data_gb, careful_data_gb, balanced_data_gb]
+    orbit_frequency_factors = np.array([5, 4, 3])
+    volumes = np.ceil(data_gb / orbit_frequency_factors)
 
     print("WYNIKI SYMULACJI:\n")
     for s, v in zip(scenarios, volumes):
@@ -1,11 +1,157 @@
+import sys
+
 import numpy as np
-import matplotlib.pyplot as plt
-from math import pi, cos, radians, sin
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from math import pi, tau, cos, radians, sin, ceil, sqrt
+from typing import NamedTuple
+
+# Stałe (float - przekazywane jawnie do jąder Numba jako argumenty float64)
+EARTH_RADIUS: float = 6371000.0  # promień Ziemi w metrach
+EARTH_SURFACE_AREA: float = 4.0 * pi * EARTH_RADIUS * EARTH_RADIUS  # powierzchnia Ziemi w m²
+EARTH_CIRCUMFERENCE: float = tau * EARTH_RADIUS  # obwód Ziemi w metrach
+EARTH_GRAVITATIONAL_PARAMETER: float = 3.986004418e14  # μ = GM w m^3/s^2
+
+# Przeliczniki czasu
+SECONDS_PER_MINUTE = 60
+SECONDS_PER_HOUR = 3600
+SECONDS_PER_DAY = 86400
+
+# Uwzględniamy krzywizne Ziemi i inne czynniki - mnożnik korekcyjny liczby zdjęć
+COVERAGE_CORRECTION_FACTOR = 1.2
+_EARTH_AREA_CORRECTED = EARTH_SURFACE_AREA * COVERAGE_CORRECTION_FACTOR
+
+# Kolejność kolumn w wynikach analyze_resolution_scenario_numeric
+NUMERIC_FIELDS = (
+    "resolution",
+    "altitude",
+    "orbital_period_minutes",
+    "swath_width_km",
+    "swath_height_km",
+    "image_width_px",
+    "image_height_px",
+    "total_pixels",
+    "image_size_mb",
+    "num_images",
+    "total_data_mb",
+    "total_data_gb",
+    "total_data_tb",
+    "time_interval_seconds",
+    "distance_interval_along_track_km",
+    "distance_interval_cross_track_km",
+    "num_strips_equator",
+    "time_for_full_coverage_hours"
+)
+
+# Szablon sekcji raportu dla pojedynczego scenariusza (pola z ScenarioResults)
+REPORT_TEMPLATE = """{idx}. SCENARIUSZ {label} - SATELITA: {r.satellite_model}
+   Wysokość orbity: {altitude_km:.0f} km
+   Typ orbity: Heliosynchroniczna (SSO)
+   Inklinacja: {r.inclination_degrees}°
+   LTAN: {r.ltan}
+   Rozmiar pojedynczego obrazu: {r.image_size_mb:.2f} MB
+   Pokrycie terenu (szerokość x wysokość): {r.swath_width_km:.2f} x {r.swath_height_km:.2f} km
+   Wymiary obrazu: {r.image_width_px} x {r.image_height_px} pikseli
+   Liczba kanałów spektralnych: {r.num_channels}
+   Liczba zdjęć na pokrycie całej Ziemi: {r.num_images:,}
+   Całkowita ilość danych: {r.total_data_tb:.2f} TB
+   Interwał czasowy między zdjęciami: {r.imaging_intervals.time_interval_seconds:.2f} s
+   Czas na pełne pokrycie Ziemi: {r.imaging_intervals.time_for_full_coverage_hours:.2f} godzin
+   Okres orbitalny: {r.orbital_period_minutes:.2f} minut
+   Liczba orbit na dzień: {r.sso_params.orbits_per_day:.2f}
+
+"""
+
+# Rozdzielczość zapisu wykresów: proste wykresy słupkowe nie zyskują na wysokim DPI
+# (tylko wolniejsza rasteryzacja), szczegóły mają znaczenie tylko na wykresie 3D orbity
+BAR_CHART_DPI = 100
+ORBIT_PLOT_DPI = 300
+
+class ImagingIntervals(NamedTuple):
+    """Interwały czasowe i odległościowe między kolejnymi zdjęciami."""
+    satellite_velocity_km_h: float
+    ground_velocity_km_h: float
+    time_interval_seconds: float
+    distance_interval_along_track_km: float
+    distance_interval_cross_track_km: float
+    longitude_interval_degrees: float
+    num_strips_equator: float
+    num_orbits_for_coverage: float
+    time_for_full_coverage_hours: float
+
+class SSOParams(NamedTuple):
+    """Parametry orbity heliosynchronicznej (SSO)."""
+    orbital_radius_km: float
+    orbital_period_minutes: float
+    orbits_per_day: float
+    repeat_cycle_days: int
+    longitude_separation_degrees: float
+    inclination_degrees: float
+    inclination_rad: float
+    nodal_precession_deg_per_day: float
 
-# Stałe
-EARTH_RADIUS = 6371000  # promień Ziemi w metrach
-EARTH_SURFACE_AREA = 4 * pi * EARTH_RADIUS**2  # powierzchnia Ziemi w m²
-EARTH_CIRCUMFERENCE = 2 * pi * EARTH_RADIUS  # obwód Ziemi w metrach
+class ScenarioResults(NamedTuple):
+    """Wyniki analizy pojedynczego scenariusza rozdzielczości."""
+    satellite_model: str
+    resolution: float
+    altitude: float
+    fov_degrees: float
+    sensor_width_mm: float
+    sensor_height_mm: float
+    pixel_size_um: float
+    num_channels: int
+    orbital_period_minutes: float
+    swath_width_km: float
+    swath_height_km: float
+    image_width_px: int
+    image_height_px: int
+    total_pixels: int
+    image_size_mb: float
+    num_images: int
+    total_data_mb: float
+    total_data_gb: float
+    total_data_tb: float
+    imaging_intervals: ImagingIntervals
+    sso_params: SSOParams
+    inclination_degrees: float
+    ltan: str
+
+def _pyplot():
+    """
+    Importuje matplotlib.pyplot dopiero przy pierwszym wykresie.
+    
+    Sam import matplotlib trwa kilkaset ms, a obliczenia numeryczne go nie
+    potrzebują. Wykresy są tylko zapisywane do plików, więc zawsze używamy
+    nieinteraktywnego backendu Agg.
+    """
+    import matplotlib as mpl
+    mpl.use('Agg')
+    import matplotlib.pyplot as plt
+    
+    # Upraszczanie ścieżek i dzielenie długich linii na fragmenty w backendzie Agg
+    mpl.rcParams['path.simplify'] = True
+    mpl.rcParams['path.simplify_threshold'] = 1.0
+    mpl.rcParams['agg.path.chunksize'] = 10000
+    
+    return plt
+
+# Moduł _kernels po pierwszym wczytaniu (patrz _get_kernels)
+_kernels_module = None
+
+def _get_kernels():
+    """
+    Zwraca moduł z jądrami Numba, importując go dopiero przy pierwszym użyciu.
+    
+    Import Numby i kompilacja (lub wczytanie z cache) jąder odbywa się przy
+    pierwszym wywołaniu funkcji skalarnych, a nie przy imporcie skryptu.
+    Moduł zapamiętywany jest w zmiennej globalnej, więc kolejne wywołania
+    nie wykonują już instrukcji import.
+    """
+    global _kernels_module
+    if _kernels_module is None:
+        import _kernels
+        _kernels_module = _kernels
+    return _kernels_module
 
 def calculate_image_size(resolution, image_width_px, image_height_px, num_channels):
     """
@@ -27,10 +173,14 @@ def calculate_image_size(resolution, image_width_px, image_height_px, num_channe
     
     return (total_pixels, image_size_mb)
 
+@lru_cache(maxsize=1024)
 def calculate_ground_coverage(altitude, fov_degrees, sensor_width_mm, sensor_height_mm, pixel_size_um):
     """
     Oblicza obszar pokrycia terenu przez pojedyncze zdjęcie.
     
+    Wyniki są zapamiętywane (lru_cache) - przy przeglądach parametrów te same
+    zestawy argumentów nie są liczone ponownie. Argumenty muszą być hashowalne.
+    
     Parametry:
     altitude (float): Wysokość orbity w metrach
     fov_degrees (float): Kąt widzenia w stopniach
@@ -41,22 +191,14 @@ def calculate_ground_coverage(altitude, fov_degrees, sensor_width_mm, sensor_hei
     Zwraca:
     tuple: (szerokość pokrycia w m, wysokość pokrycia w m, szerokość w px, wysokość w px)
     """
-    fov_rad = radians(fov_degrees)
-    swath_width = 2 * altitude * np.tan(fov_rad / 2)
-    
-    # Proporcja sensora
-    aspect_ratio = sensor_width_mm / sensor_height_mm
-    
-    # Obliczamy wysokość pokrycia (w kierunku lotu)
-    swath_height = swath_width / aspect_ratio
-    
-    # Obliczamy rozdzielczość w pikselach
-    width_px = int(sensor_width_mm * 1000 / pixel_size_um)
-    height_px = int(sensor_height_mm * 1000 / pixel_size_um)
+    swath_width, swath_height, width_px, height_px = _get_kernels().ground_coverage_core(
+        float(altitude), float(fov_degrees), float(sensor_width_mm),
+        float(sensor_height_mm), float(pixel_size_um)
+    )
     
-    return (swath_width, swath_height, width_px, height_px)
+    return (swath_width, swath_height, int(width_px), int(height_px))
 
-def calculate_number_of_images(resolution, swath_width, swath_height, overlap_percent=10):
+def calculate_number_of_images(resolution, swath_width, swath_height, overlap_percent=10, overlap_factor=None):
     """
     Oblicza liczbę zdjęć potrzebnych do pokrycia całej Ziemi.
     
@@ -65,70 +207,73 @@ def calculate_number_of_images(resolution, swath_width, swath_height, overlap_pe
     swath_width (float): Szerokość pasa pokrycia w metrach
     swath_height (float): Wysokość pasa pokrycia w metrach
     overlap_percent (float): Procent nakładania się obrazów
+    overlap_factor (float): Wyliczone wcześniej (1 - overlap_percent/100) (opcjonalne)
     
     Zwraca:
     int: Liczba zdjęć potrzebnych do pokrycia Ziemi
     """
-    effective_width = swath_width * (1 - overlap_percent/100)
-    effective_height = swath_height * (1 - overlap_percent/100)
+    if overlap_factor is None:
+        overlap_factor = 1 - overlap_percent/100
+    
+    effective_width = swath_width * overlap_factor
+    effective_height = swath_height * overlap_factor
     
     effective_area = effective_width * effective_height
     
-    # Uwzględniamy krzywizne Ziemi i inne czynniki - mnożnik korekcyjny
-    correction_factor = 1.2
+    # Liczba zdjęć potrzebnych do pokrycia całej Ziemi (z mnożnikiem korekcyjnym)
+    return ceil(_EARTH_AREA_CORRECTED / effective_area)
+
+def calculate_orbital_period_seconds(orbital_radius):
+    """
+    Oblicza okres orbitalny dla orbity kołowej.
     
-    # Liczba zdjęć potrzebnych do pokrycia całej Ziemi
-    num_images = (EARTH_SURFACE_AREA / effective_area) * correction_factor
+    Parametry:
+    orbital_radius (float): Promień orbity w metrach (EARTH_RADIUS + wysokość)
     
-    return int(np.ceil(num_images))
+    Zwraca:
+    float: Okres orbitalny w sekundach
+    """
+    # T = 2π * sqrt(a^3 / μ), gdzie μ = GM
+    return tau * sqrt(orbital_radius**3 / EARTH_GRAVITATIONAL_PARAMETER)
 
-def calculate_sso_orbit_parameters(altitude, inclination_degrees=98):
+def calculate_sso_orbit_parameters(altitude, inclination_degrees=98,
+                                   orbital_radius=None, orbital_period_seconds=None):
     """
     Oblicza dodatkowe parametry dla orbity heliosynchronicznej (SSO).
     
     Parametry:
     altitude (float): Wysokość orbity w metrach
     inclination_degrees (float): Inklinacja orbity w stopniach
+    orbital_radius (float): Wyliczony wcześniej promień orbity w metrach (opcjonalne)
+    orbital_period_seconds (float): Wyliczony wcześniej okres orbitalny w sekundach (opcjonalne)
     
     Zwraca:
-    dict: Słownik z parametrami orbity SSO
+    SSOParams: Parametry orbity SSO
     """
-    # Parametry orbity
-    orbital_radius = EARTH_RADIUS + altitude
+    if orbital_radius is None:
+        orbital_radius = EARTH_RADIUS + altitude
+    if orbital_period_seconds is None:
+        orbital_period_seconds = calculate_orbital_period_seconds(orbital_radius)
+    
+    (orbital_radius_km, orbital_period_minutes, orbits_per_day,
+     repeat_cycle_days, longitude_separation_degrees) = _get_kernels().sso_orbit_core(
+        float(orbital_radius), float(orbital_period_seconds), SECONDS_PER_MINUTE, SECONDS_PER_DAY
+    )
     
     # Przesunięcie węzła orbity na dzień (przesunięcie precesyjne)
     # Dla SSO to około 0.9856° na dzień (360° / 365.25 dni)
     nodal_precession_deg_per_day = 0.9856
     
-    # Obliczenie okresu orbitalnego
-    # T = 2π * sqrt(a^3 / μ), gdzie μ = GM
-    earth_gravitational_parameter = 3.986004418e14  # m^3/s^2
-    orbital_period_seconds = 2 * pi * np.sqrt(orbital_radius**3 / earth_gravitational_parameter)
-    orbital_period_minutes = orbital_period_seconds / 60
-    
-    # Liczba orbit na dzień
-    orbits_per_day = 24 * 60 * 60 / orbital_period_seconds
-    
-    # Rozdzielczość czasowa powtórzeń (rewizyt) dla danego obszaru
-    # Satellite ground track repeat cycle
-    repeat_cycle_days = np.ceil(orbits_per_day)  # zaokrąglenie w górę do pełnego dnia
-    
-    # Obliczenie kąta separacji między kolejnymi orbitami na równiku
-    longitude_separation_degrees = 360 / orbits_per_day
-    
-    results = {
-        "orbital_radius_km": orbital_radius / 1000,
-        "orbital_period_minutes": orbital_period_minutes,
-        "orbits_per_day": orbits_per_day,
-        "repeat_cycle_days": repeat_cycle_days,
-        "longitude_separation_degrees": longitude_separation_degrees,
-        "inclination_degrees": inclination_degrees,
-        "nodal_precession_deg_per_day": nodal_precession_deg_per_day
-    }
-    
-    return results
+    # Pola podawane pozycyjnie (kolejność jak w SSOParams) - tworzenie z argumentami
+    # nazwanymi jest wyraźnie wolniejsze przy wielokrotnych wywołaniach
+    return SSOParams(
+        orbital_radius_km, orbital_period_minutes, orbits_per_day, int(repeat_cycle_days),
+        longitude_separation_degrees, inclination_degrees, radians(inclination_degrees),
+        nodal_precession_deg_per_day
+    )
 
-def calculate_imaging_intervals(altitude, swath_width, swath_height, overlap_percent=10, orbital_period_minutes=90):
+def calculate_imaging_intervals(altitude, swath_width, swath_height, overlap_percent=10, orbital_period_minutes=90,
+                                overlap_factor=None, orbital_radius=None, orbital_period_seconds=None):
     """
     Oblicza interwały czasowe i odległościowe między kolejnymi zdjęciami.
     
@@ -138,85 +283,39 @@ def calculate_imaging_intervals(altitude, swath_width, swath_height, overlap_per
     swath_height (float): Wysokość pokrycia w metrach (w kierunku lotu)
     overlap_percent (float): Procent nakładania się obrazów
     orbital_period_minutes (float): Okres orbitalny w minutach
+    overlap_factor (float): Wyliczone wcześniej (1 - overlap_percent/100) (opcjonalne)
+    orbital_radius (float): Wyliczony wcześniej promień orbity w metrach (opcjonalne)
+    orbital_period_seconds (float): Okres orbitalny w sekundach; ma pierwszeństwo
+                                    przed orbital_period_minutes (opcjonalne)
     
     Zwraca:
-    dict: Słownik z obliczonymi interwałami
+    ImagingIntervals: Obliczone interwały
     """
-    # Obliczenia dla pokrycia wzdłuż toru lotu (along-track)
-    effective_height = swath_height * (1 - overlap_percent/100)
-    
-    # Obliczenie prędkości naziemnej satelity
-    orbital_radius = EARTH_RADIUS + altitude
-    orbital_circumference = 2 * pi * orbital_radius  # obwód orbity w metrach
-    orbital_period_seconds = orbital_period_minutes * 60
-    satellite_velocity = orbital_circumference / orbital_period_seconds  # m/s
-    ground_velocity = satellite_velocity * (EARTH_RADIUS / orbital_radius)  # m/s
-    
-    # Obliczenie co ile sekund należy wykonać zdjęcie wzdłuż toru lotu
-    time_interval_seconds = effective_height / ground_velocity
-    
-    # Obliczenie co ile metrów należy wykonać zdjęcie wzdłuż toru lotu
-    distance_interval_along_track = effective_height
-    
-    # Obliczenia dla pokrycia w poprzek toru lotu (cross-track)
-    effective_width = swath_width * (1 - overlap_percent/100)
-    
-    # Ile pasów potrzeba, aby pokryć cały równik
-    num_strips_equator = np.ceil(EARTH_CIRCUMFERENCE / effective_width)
-    
-    # Co ile stopni długości geograficznej powinien przechodzić tor orbity
-    longitude_interval_degrees = 360 / num_strips_equator
-    
-    # Co ile metrów na równiku należy wykonać pas zdjęć
-    distance_interval_cross_track = EARTH_CIRCUMFERENCE / num_strips_equator
-    
-    # Ile orbit potrzeba, aby pokryć całą Ziemię
-    num_orbits_for_coverage = num_strips_equator / 2  # Zakładając orbitę polarną
-    
-    # Ile czasu zajmie pełne pokrycie Ziemi (w godzinach)
-    time_for_full_coverage_hours = (num_orbits_for_coverage * orbital_period_minutes) / 60
-    
-    results = {
-        "satellite_velocity_km_h": satellite_velocity * 3.6,  # km/h
-        "ground_velocity_km_h": ground_velocity * 3.6,  # km/h
-        "time_interval_seconds": time_interval_seconds,
-        "distance_interval_along_track_km": distance_interval_along_track / 1000,
-        "distance_interval_cross_track_km": distance_interval_cross_track / 1000,
-        "longitude_interval_degrees": longitude_interval_degrees,
-        "num_strips_equator": num_strips_equator,
-        "num_orbits_for_coverage": num_orbits_for_coverage,
-        "time_for_full_coverage_hours": time_for_full_coverage_hours
-    }
-    
-    return results
+    if overlap_factor is None:
+        overlap_factor = 1 - overlap_percent/100
+    if orbital_radius is None:
+        orbital_radius = EARTH_RADIUS + altitude
+    if orbital_period_seconds is None:
+        orbital_period_seconds = orbital_period_minutes * SECONDS_PER_MINUTE
+    
+    return ImagingIntervals(*_get_kernels().imaging_intervals_core(
+        float(orbital_radius), float(orbital_period_seconds), float(swath_width),
+        float(swath_height), float(overlap_factor), EARTH_RADIUS, EARTH_CIRCUMFERENCE,
+        SECONDS_PER_HOUR
+    ))
 
-def calculate_total_data_volume(resolution, num_images, image_size_mb):
-    """
-    Oblicza całkowitą ilość danych generowanych w ciągu doby.
-    
-    Parametry:
-    resolution (float): Rozdzielczość przestrzenna w m/px
-    num_images (int): Liczba zdjęć potrzebnych do pokrycia Ziemi
-    image_size_mb (float): Rozmiar pojedynczego zdjęcia w MB
-    
-    Zwraca:
-    tuple: (całkowita ilość danych w MB, całkowita ilość danych w GB, całkowita ilość danych w TB)
-    """
-    total_data_mb = num_images * image_size_mb
-    total_data_gb = total_data_mb / 1024
-    total_data_tb = total_data_gb / 1024
-    
-    return (total_data_mb, total_data_gb, total_data_tb)
-
-def visualize_imaging_intervals(high_res_intervals, low_res_intervals, sso_intervals):
+def visualize_imaging_intervals(high_res_intervals, low_res_intervals, sso_intervals, dpi=BAR_CHART_DPI):
     """
     Wizualizuje interwały robienia zdjęć dla różnych rozdzielczości i typów orbity.
     
     Parametry:
-    high_res_intervals (dict): Wyniki obliczeń interwałów dla wysokiej rozdzielczości
-    low_res_intervals (dict): Wyniki obliczeń interwałów dla niskiej rozdzielczości
-    sso_intervals (dict): Wyniki obliczeń interwałów dla orbity SSO
+    high_res_intervals (ImagingIntervals): Wyniki obliczeń interwałów dla wysokiej rozdzielczości
+    low_res_intervals (ImagingIntervals): Wyniki obliczeń interwałów dla niskiej rozdzielczości
+    sso_intervals (ImagingIntervals): Wyniki obliczeń interwałów dla orbity SSO
+    dpi (int): Rozdzielczość zapisywanego pliku PNG
     """
+    plt = _pyplot()
+    
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
     
     # Dane do wykresu odstępów czasowych
@@ -226,9 +325,9 @@ def visualize_imaging_intervals(high_res_intervals, low_res_intervals, sso_inter
         'SSO\n(10 m/px)'
     ]
     time_intervals = [
-        high_res_intervals["time_interval_seconds"], 
-        low_res_intervals["time_interval_seconds"],
-        sso_intervals["time_interval_seconds"]
+        high_res_intervals.time_interval_seconds, 
+        low_res_intervals.time_interval_seconds,
+        sso_intervals.time_interval_seconds
     ]
     
     bars1 = ax1.bar(scenarios, time_intervals, color=['darkred', 'navy', 'green'])
@@ -237,16 +336,13 @@ def visualize_imaging_intervals(high_res_intervals, low_res_intervals, sso_inter
     ax1.grid(axis='y', linestyle='--', alpha=0.7)
     
     # Dodanie etykiet wartości na słupkach
-    for bar in bars1:
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                f'{height:.2f} s', ha='center', va='bottom', fontweight='bold')
+    ax1.bar_label(bars1, fmt='%.2f s', padding=3, fontweight='bold')
     
     # Dane do wykresu odstępów przestrzennych
     distance_intervals = [
-        high_res_intervals["distance_interval_along_track_km"], 
-        low_res_intervals["distance_interval_along_track_km"],
-        sso_intervals["distance_interval_along_track_km"]
+        high_res_intervals.distance_interval_along_track_km, 
+        low_res_intervals.distance_interval_along_track_km,
+        sso_intervals.distance_interval_along_track_km
     ]
     
     bars2 = ax2.bar(scenarios, distance_intervals, color=['darkred', 'navy', 'green'])
@@ -255,13 +351,11 @@ def visualize_imaging_intervals(high_res_intervals, low_res_intervals, sso_inter
     ax2.grid(axis='y', linestyle='--', alpha=0.7)
     
     # Dodanie etykiet wartości na słupkach
-    for bar in bars2:
-        height = bar.get_height()
-        ax2.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                f'{height:.2f} km', ha='center', va='bottom', fontweight='bold')
+    ax2.bar_label(bars2, fmt='%.2f km', padding=3, fontweight='bold')
     
     plt.tight_layout()
-    plt.savefig('interwaly_obrazowania.png', dpi=300, bbox_inches='tight')
+    plt.savefig('interwaly_obrazowania.png', dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
     
     return fig
 
@@ -289,7 +383,7 @@ def analyze_resolution_scenario(resolution, altitude, fov_degrees,
     ltan (str): Czas lokalny węzła wstępującego (opcjonalne)
     
     Zwraca:
-    dict: Słownik z wynikami analizy
+    ScenarioResults: Wyniki analizy
     """
     # Obliczenia pokrycia terenu
     swath_width, swath_height, width_px, height_px = calculate_ground_coverage(
@@ -301,40 +395,172 @@ def analyze_resolution_scenario(resolution, altitude, fov_degrees,
         resolution, width_px, height_px, num_channels
     )
     
+    # Współczynnik nakładania się obrazów - wspólny dla liczby zdjęć i interwałów
+    overlap_factor = 1 - overlap_percent/100
+    
     # Obliczenia liczby obrazów
     num_images = calculate_number_of_images(
-        resolution, swath_width, swath_height, overlap_percent
+        resolution, swath_width, swath_height, overlap_percent, overlap_factor
     )
     
+    # Promień i okres orbity liczone raz - wspólne dla parametrów SSO i interwałów
+    orbital_radius = EARTH_RADIUS + altitude
+    
     # Obliczenia parametrów orbity SSO jeśli podano inklinację
     if inclination_degrees is not None:
+        orbital_period_seconds = calculate_orbital_period_seconds(orbital_radius)
         sso_params = calculate_sso_orbit_parameters(
-            altitude, inclination_degrees
+            altitude, inclination_degrees, orbital_radius, orbital_period_seconds
         )
-        orbital_period_minutes = sso_params["orbital_period_minutes"]
+        orbital_period_minutes = sso_params.orbital_period_minutes
     else:
+        orbital_period_seconds = orbital_period_minutes * SECONDS_PER_MINUTE
         sso_params = None
     
     # Obliczenia interwałów obrazowania
     imaging_intervals = calculate_imaging_intervals(
-        altitude, swath_width, swath_height, overlap_percent, orbital_period_minutes
+        altitude, swath_width, swath_height, overlap_percent, orbital_period_minutes,
+        overlap_factor, orbital_radius, orbital_period_seconds
     )
     
     # Całkowita ilość danych
-    total_data_mb, total_data_gb, total_data_tb = calculate_total_data_volume(
-        resolution, num_images, image_size_mb
-    )
+    total_data_mb = num_images * image_size_mb
+    total_data_gb = total_data_mb / 1024
+    total_data_tb = total_data_mb / (1024 * 1024)
     
     # Przygotowanie wyników
+    results = ScenarioResults(
+        satellite_model=satellite_model,
+        resolution=resolution,
+        altitude=altitude,
+        fov_degrees=fov_degrees,
+        sensor_width_mm=sensor_width_mm,
+        sensor_height_mm=sensor_height_mm,
+        pixel_size_um=pixel_size_um,
+        num_channels=num_channels,
+        orbital_period_minutes=orbital_period_minutes,
+        swath_width_km=swath_width / 1000,
+        swath_height_km=swath_height / 1000,
+        image_width_px=width_px,
+        image_height_px=height_px,
+        total_pixels=total_pixels,
+        image_size_mb=image_size_mb,
+        num_images=num_images,
+        total_data_mb=total_data_mb,
+        total_data_gb=total_data_gb,
+        total_data_tb=total_data_tb,
+        imaging_intervals=imaging_intervals,
+        sso_params=sso_params,  # Dodane parametry SSO
+        inclination_degrees=inclination_degrees,  # Dodana inklinacja
+        ltan=ltan  # Dodany LTAN
+    )
+    
+    return results
+
+def analyze_resolution_scenarios_batch(resolutions, altitudes, fov_degrees,
+                                       sensor_widths_mm, sensor_heights_mm,
+                                       pixel_sizes_um, num_channels,
+                                       overlap_percent=10, orbital_period_minutes=90,
+                                       inclination_degrees=None):
+    """
+    Przeprowadza analizę wielu scenariuszy naraz (układ SoA - słownik tablic).
+    
+    Wszystkie parametry mogą być tablicami NumPy (lub skalarami) i są
+    rozgłaszane (broadcasting) do wspólnego kształtu. Obliczenia odpowiadają
+    analyze_resolution_scenario, ale wykonywane są jednym przebiegiem NumPy.
+    
+    Parametry:
+    resolutions (array): Rozdzielczości przestrzenne w m/px
+    altitudes (array): Wysokości orbity w metrach
+    fov_degrees (array): Kąty widzenia w stopniach
+    sensor_widths_mm (array): Szerokości matrycy w mm
+    sensor_heights_mm (array): Wysokości matrycy w mm
+    pixel_sizes_um (array): Rozmiary piksela w mikrometrach
+    num_channels (array): Liczby kanałów spektralnych
+    overlap_percent (array): Procent nakładania się obrazów
+    orbital_period_minutes (array): Okres orbitalny w minutach
+    inclination_degrees (array): Inklinacja orbity w stopniach (opcjonalne) -
+        jeśli podana, okres orbitalny wyliczany jest z wysokości jak dla SSO
+        (dla wszystkich scenariuszy), a wyniki zawierają też parametry SSO
+    
+    Zwraca:
+    dict: Słownik tablic z wynikami analizy (klucze jak pola ScenarioResults)
+    """
+    # Rozgłoszenie parametrów do wspólnego kształtu - jeden element na scenariusz
+    (resolutions, altitudes, fov_degrees, sensor_widths_mm, sensor_heights_mm,
+     pixel_sizes_um, overlap_percent, orbital_period_minutes) = np.broadcast_arrays(
+        *(np.asarray(a, dtype=np.float64) for a in (
+            resolutions, altitudes, fov_degrees, sensor_widths_mm, sensor_heights_mm,
+            pixel_sizes_um, overlap_percent, orbital_period_minutes
+        ))
+    )
+    num_channels = np.broadcast_to(np.asarray(num_channels, dtype=np.int64), resolutions.shape)
+    overlap_factor = 1 - overlap_percent/100
+    
+    # Kąty przeliczane na radiany raz, dla wszystkich scenariuszy naraz
+    fov_rad = np.deg2rad(fov_degrees)
+    
+    # Pokrycie terenu
+    swath_width = 2 * altitudes * np.tan(fov_rad / 2)
+    swath_height = swath_width / (sensor_widths_mm / sensor_heights_mm)
+    width_px = np.trunc(sensor_widths_mm * 1000 / pixel_sizes_um).astype(np.int64)
+    height_px = np.trunc(sensor_heights_mm * 1000 / pixel_sizes_um).astype(np.int64)
+    
+    # Rozmiar obrazu (2 bajty na piksel na kanał)
+    total_pixels = width_px * height_px
+    image_size_mb = total_pixels * num_channels * 2 / (1024 * 1024)
+    
+    # Liczba obrazów
+    effective_width = swath_width * overlap_factor
+    effective_height = swath_height * overlap_factor
+    num_images = np.ceil(_EARTH_AREA_CORRECTED / (effective_width * effective_height)).astype(np.int64)
+    
+    # Okres orbitalny - dla SSO wyliczany z wysokości orbity
+    orbital_radius = EARTH_RADIUS + altitudes
+    if inclination_degrees is not None:
+        inclination_degrees = np.broadcast_to(inclination_degrees, resolutions.shape)
+        orbital_period_seconds = tau * np.sqrt(orbital_radius**3 / EARTH_GRAVITATIONAL_PARAMETER)
+        orbital_period_minutes = orbital_period_seconds / SECONDS_PER_MINUTE
+        orbits_per_day = SECONDS_PER_DAY / orbital_period_seconds
+        sso_params = {
+            "orbital_radius_km": orbital_radius / 1000,
+            "orbital_period_minutes": orbital_period_minutes,
+            "orbits_per_day": orbits_per_day,
+            "repeat_cycle_days": np.ceil(orbits_per_day).astype(np.int64),
+            "longitude_separation_degrees": 360 / orbits_per_day,
+            "inclination_degrees": inclination_degrees,
+            "inclination_rad": np.deg2rad(inclination_degrees),
+            "nodal_precession_deg_per_day": np.full(resolutions.shape, 0.9856)
+        }
+    else:
+        orbital_period_seconds = orbital_period_minutes * SECONDS_PER_MINUTE
+        sso_params = None
+    
+    # Interwały obrazowania
+    satellite_velocity = tau * orbital_radius / orbital_period_seconds
+    ground_velocity = satellite_velocity * (EARTH_RADIUS / orbital_radius)
+    num_strips_equator = np.ceil(EARTH_CIRCUMFERENCE / effective_width)
+    num_orbits_for_coverage = num_strips_equator / 2
+    imaging_intervals = {
+        "satellite_velocity_km_h": satellite_velocity * 3.6,
+        "ground_velocity_km_h": ground_velocity * 3.6,
+        "time_interval_seconds": effective_height / ground_velocity,
+        "distance_interval_along_track_km": effective_height / 1000,
+        "distance_interval_cross_track_km": EARTH_CIRCUMFERENCE / num_strips_equator / 1000,
+        "longitude_interval_degrees": 360 / num_strips_equator,
+        "num_strips_equator": num_strips_equator,
+        "num_orbits_for_coverage": num_orbits_for_coverage,
+        "time_for_full_coverage_hours": num_orbits_for_coverage * orbital_period_seconds / SECONDS_PER_HOUR
+    }
+    
+    # Całkowita ilość danych
+    total_data_mb = num_images * image_size_mb
+    total_data_gb = total_data_mb / 1024
+    total_data_tb = total_data_mb / (1024 * 1024)
+    
     results = {
-        "satellite_model": satellite_model,
-        "resolution": resolution,
-        "altitude": altitude,
-        "fov_degrees": fov_degrees,
-        "sensor_width_mm": sensor_width_mm,
-        "sensor_height_mm": sensor_height_mm,
-        "pixel_size_um": pixel_size_um,
-        "num_channels": num_channels,
+        "resolution": resolutions,
+        "altitude": altitudes,
         "orbital_period_minutes": orbital_period_minutes,
         "swath_width_km": swath_width / 1000,
         "swath_height_km": swath_height / 1000,
@@ -347,100 +573,197 @@ def analyze_resolution_scenario(resolution, altitude, fov_degrees,
         "total_data_gb": total_data_gb,
         "total_data_tb": total_data_tb,
         "imaging_intervals": imaging_intervals,
-        "sso_params": sso_params,  # Dodane parametry SSO
-        "inclination_degrees": inclination_degrees,  # Dodana inklinacja
-        "ltan": ltan  # Dodany LTAN
+        "sso_params": sso_params
     }
     
     return results
 
-def visualize_comparison(high_res_results, low_res_results, sso_results):
+def _scenario_from_batch(batch, i, params):
+    """
+    Wybiera i-ty scenariusz z wyników analyze_resolution_scenarios_batch.
+    
+    Parametry:
+    batch (dict): Wyniki analyze_resolution_scenarios_batch
+    i (int): Indeks scenariusza
+    params (dict): Parametry wejściowe scenariusza (jak dla analyze_resolution_scenario)
+    
+    Zwraca:
+    ScenarioResults: Wyniki analizy i-tego scenariusza
+    """
+    sso_params = batch["sso_params"]
+    if sso_params is not None:
+        sso_params = SSOParams(**{key: values[i].item() for key, values in sso_params.items()})
+    
+    return ScenarioResults(
+        satellite_model=params.get("satellite_model", "Nieokreślony"),
+        resolution=params["resolution"],
+        altitude=params["altitude"],
+        fov_degrees=params["fov_degrees"],
+        sensor_width_mm=params["sensor_width_mm"],
+        sensor_height_mm=params["sensor_height_mm"],
+        pixel_size_um=params["pixel_size_um"],
+        num_channels=params["num_channels"],
+        orbital_period_minutes=batch["orbital_period_minutes"][i].item(),
+        swath_width_km=batch["swath_width_km"][i].item(),
+        swath_height_km=batch["swath_height_km"][i].item(),
+        image_width_px=batch["image_width_px"][i].item(),
+        image_height_px=batch["image_height_px"][i].item(),
+        total_pixels=batch["total_pixels"][i].item(),
+        image_size_mb=batch["image_size_mb"][i].item(),
+        num_images=batch["num_images"][i].item(),
+        total_data_mb=batch["total_data_mb"][i].item(),
+        total_data_gb=batch["total_data_gb"][i].item(),
+        total_data_tb=batch["total_data_tb"][i].item(),
+        imaging_intervals=ImagingIntervals(
+            **{key: values[i].item() for key, values in batch["imaging_intervals"].items()}
+        ),
+        sso_params=sso_params,
+        inclination_degrees=params.get("inclination_degrees"),
+        ltan=params.get("ltan")
+    )
+
+def analyze_resolution_scenario_numeric(resolution, altitude, fov_degrees,
+                                        sensor_width_mm, sensor_height_mm,
+                                        pixel_size_um, num_channels,
+                                        overlap_percent=10, orbital_period_minutes=90,
+                                        inclination_degrees=None):
+    """
+    Przeprowadza analizę scenariusza zwracając wyłącznie wyniki liczbowe.
+    
+    Parametry jak w analyze_resolution_scenarios_batch (skalary lub tablice).
+    Opisy tekstowe (np. model satelity) przechowuje wywołujący osobno.
+    
+    Zwraca:
+    np.ndarray: Tablica float64 z kolumnami w kolejności NUMERIC_FIELDS -
+        1-D dla skalarnych parametrów, 2-D (liczba scenariuszy, len(NUMERIC_FIELDS))
+        dla tablic parametrów
+    """
+    batch = analyze_resolution_scenarios_batch(
+        resolution, altitude, fov_degrees, sensor_width_mm, sensor_height_mm,
+        pixel_size_um, num_channels, overlap_percent, orbital_period_minutes,
+        inclination_degrees
+    )
+    intervals = batch["imaging_intervals"]
+    columns = [batch[f] if f in batch else intervals[f] for f in NUMERIC_FIELDS]
+    
+    return np.stack(np.broadcast_arrays(*columns), axis=-1).astype(np.float64)
+
+def visualize_comparison(high_res_results, low_res_results, sso_results, dpi=BAR_CHART_DPI):
     """
     Wizualizuje porównanie scenariuszy wysokiej i niskiej rozdzielczości oraz SSO.
     
     Parametry:
-    high_res_results (dict): Wyniki analizy scenariusza wysokiej rozdzielczości
-    low_res_results (dict): Wyniki analizy scenariusza niskiej rozdzielczości
-    sso_results (dict): Wyniki analizy scenariusza dla orbity SSO
+    high_res_results (ScenarioResults): Wyniki analizy scenariusza wysokiej rozdzielczości
+    low_res_results (ScenarioResults): Wyniki analizy scenariusza niskiej rozdzielczości
+    sso_results (ScenarioResults): Wyniki analizy scenariusza dla orbity SSO
+    dpi (int): Rozdzielczość zapisywanego pliku PNG
     """
+    plt = _pyplot()
+    
     # Dane do wykresu
     scenarios = [
-        f"{high_res_results['satellite_model']}\n(1 m/px)", 
-        f"{low_res_results['satellite_model']}\n(250 m/px)",
-        f"{sso_results['satellite_model']}\n(10 m/px)"
-    ]
-    data_tb = [
-        high_res_results["total_data_tb"], 
-        low_res_results["total_data_tb"],
-        sso_results["total_data_tb"]
+        f"{high_res_results.satellite_model}\n(1 m/px)", 
+        f"{low_res_results.satellite_model}\n(250 m/px)",
+        f"{sso_results.satellite_model}\n(10 m/px)"
     ]
+    data_tb = np.fromiter(
+        (r.total_data_tb for r in (high_res_results, low_res_results, sso_results)),
+        dtype=np.float64, count=3
+    )
     
     fig, ax = plt.subplots(figsize=(12, 7))
     bars = ax.bar(scenarios, data_tb, color=['darkred', 'navy', 'green'])
     
     # Dodanie etykiet wartości na słupkach
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                f'{height:.2f} TB', ha='center', va='bottom', fontweight='bold')
+    ax.bar_label(bars, fmt='%.2f TB', padding=3, fontweight='bold')
     
     ax.set_ylabel('Dzienna ilość danych [TB]')
     ax.set_title('Porównanie dziennej ilości danych dla różnych satelitów i rozdzielczości')
     ax.grid(axis='y', linestyle='--', alpha=0.7)
     
     # Ustawienie logarytmicznej skali dla osi Y jeśli różnica jest duża
-    if max(data_tb) / min(data_tb) > 100:
+    if data_tb.max() / data_tb.min() > 100:
         ax.set_yscale('log')
         ax.set_ylabel('Dzienna ilość danych [TB] (skala logarytmiczna)')
     
     plt.tight_layout()
-    plt.savefig('porownanie_ilosci_danych.png', dpi=300, bbox_inches='tight')
+    plt.savefig('porownanie_ilosci_danych.png', dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
     
     return fig
 
-def visualize_sso_orbits(sso_results):
+@lru_cache(maxsize=4)
+def _earth_mesh(n=100):
+    """
+    Siatka kuli ziemskiej do wykresów 3D, liczona raz i współdzielona między wywołaniami.
+    
+    Parametry:
+    n (int): Liczba punktów siatki w każdym kierunku
+    
+    Zwraca:
+    tuple: (x, y, z) - tablice n x n (float32) w tysiącach km (tylko do odczytu)
+    """
+    # Siatka służy tylko do rysowania - precyzja float32 wystarcza, a tablice są o połowę mniejsze
+    u = np.linspace(0, tau, n, dtype=np.float32)
+    v = np.linspace(0, np.pi, n, dtype=np.float32)
+    radius = np.float32(EARTH_RADIUS / 1000000)  # konwersja na tysiące km
+    
+    # Funkcje trygonometryczne liczone raz, siatka 2D przez broadcasting
+    cos_u, sin_u = np.cos(u), np.sin(u)
+    cos_v, sin_v = np.cos(v), np.sin(v)
+    radius_sin_v = radius * sin_v
+    x = cos_u[:, None] * radius_sin_v[None, :]
+    y = sin_u[:, None] * radius_sin_v[None, :]
+    z = np.broadcast_to(radius * cos_v, (n, n))
+    
+    # Tablice są współdzielone przez cache - blokujemy ich modyfikację
+    for axis in (x, y, z):
+        axis.setflags(write=False)
+    
+    return (x, y, z)
+
+def visualize_sso_orbits(sso_results, dpi=ORBIT_PLOT_DPI):
     """
     Wizualizuje orbity SSO.
     
     Parametry:
-    sso_results (dict): Wyniki analizy scenariusza dla orbity SSO
+    sso_results (ScenarioResults): Wyniki analizy scenariusza dla orbity SSO
+    dpi (int): Rozdzielczość zapisywanego pliku PNG
     """
+    plt = _pyplot()
+    
     fig = plt.figure(figsize=(10, 8))
     ax = fig.add_subplot(111, projection='3d')
     
     # Rysowanie kuli ziemskiej
-    u = np.linspace(0, 2 * np.pi, 100)
-    v = np.linspace(0, np.pi, 100)
-    x = EARTH_RADIUS * np.outer(np.cos(u), np.sin(v)) / 1000000  # konwersja na tysiące km
-    y = EARTH_RADIUS * np.outer(np.sin(u), np.sin(v)) / 1000000
-    z = EARTH_RADIUS * np.outer(np.ones(np.size(u)), np.cos(v)) / 1000000
+    x, y, z = _earth_mesh()
     
     # Przezroczysty glob ziemski
     ax.plot_surface(x, y, z, color='b', alpha=0.1)
     
     # Rysowanie orbity SSO
-    orbital_radius = sso_results["sso_params"]["orbital_radius_km"]
-    inclination = np.radians(sso_results["inclination_degrees"])
+    orbital_radius = sso_results.sso_params.orbital_radius_km
+    inclination = sso_results.sso_params.inclination_rad
     
-    theta = np.linspace(0, 2 * np.pi, 100)
+    theta = np.linspace(0, tau, 100, dtype=np.float32)
     orbit_x = orbital_radius * np.cos(theta) / 1000  # konwersja na tysiące km
-    orbit_y = orbital_radius * np.sin(theta) * np.cos(inclination) / 1000
-    orbit_z = orbital_radius * np.sin(theta) * np.sin(inclination) / 1000
+    orbit_y = orbital_radius * np.sin(theta) * cos(inclination) / 1000
+    orbit_z = orbital_radius * np.sin(theta) * sin(inclination) / 1000
     
     ax.plot(orbit_x, orbit_y, orbit_z, 'r-', linewidth=2)
     
     # Rysowanie wektora LTAN (kierunek Słońca)
-    if sso_results["ltan"]:
+    if sso_results.ltan:
         # Konwersja LTAN (np. 10:30) na kąt
-        ltan_parts = sso_results["ltan"].split(":")
+        ltan_parts = sso_results.ltan.split(":")
         ltan_hours = int(ltan_parts[0])
         ltan_minutes = int(ltan_parts[1]) if len(ltan_parts) > 1 else 0
         ltan_angle = (ltan_hours + ltan_minutes/60) * 15  # 15 stopni na godzinę
-        ltan_rad = np.radians(ltan_angle)
+        ltan_rad = radians(ltan_angle)
         
         # Wektor kierunku Słońca
-        sun_x = 1.5 * orbital_radius * np.cos(ltan_rad) / 1000
-        sun_y = 1.5 * orbital_radius * np.sin(ltan_rad) / 1000
+        sun_x = 1.5 * orbital_radius * cos(ltan_rad) / 1000
+        sun_y = 1.5 * orbital_radius * sin(ltan_rad) / 1000
         sun_z = 0
         
         ax.quiver(0, 0, 0, sun_x, sun_y, sun_z, color='y', arrow_length_ratio=0.1, label='Słońce (LTAN)')
@@ -449,23 +772,50 @@ def visualize_sso_orbits(sso_results):
     ax.set_xlabel('X [tysiące km]')
     ax.set_ylabel('Y [tysiące km]')
     ax.set_zlabel('Z [tysiące km]')
-    ax.set_title(f'Orbita SSO - {sso_results["satellite_model"]} (wysokość: {sso_results["altitude"]/1000:.0f} km)')
+    ax.set_title(f'Orbita SSO - {sso_results.satellite_model} (wysokość: {sso_results.altitude/1000:.0f} km)')
     
     # Legendy i informacje
     info_text = (
-        f'Wysokość: {sso_results["altitude"]/1000:.0f} km\n'
-        f'Inklinacja: {sso_results["inclination_degrees"]}°\n'
-        f'LTAN: {sso_results["ltan"]}\n'
-        f'Orbity/dzień: {sso_results["sso_params"]["orbits_per_day"]:.2f}\n'
-        f'Okres: {sso_results["sso_params"]["orbital_period_minutes"]:.2f} min'
+        f'Wysokość: {sso_results.altitude/1000:.0f} km\n'
+        f'Inklinacja: {sso_results.inclination_degrees}°\n'
+        f'LTAN: {sso_results.ltan}\n'
+        f'Orbity/dzień: {sso_results.sso_params.orbits_per_day:.2f}\n'
+        f'Okres: {sso_results.sso_params.orbital_period_minutes:.2f} min'
     )
     plt.figtext(0.02, 0.02, info_text, fontsize=9, bbox=dict(facecolor='white', alpha=0.8))
     
     plt.tight_layout()
-    plt.savefig('wizualizacja_orbity_sso.png', dpi=300, bbox_inches='tight')
+    plt.savefig('wizualizacja_orbity_sso.png', dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
     
     return fig
 
+def _render_figures(visualize, *args):
+    """
+    Rysuje i zapisuje wykres w procesie roboczym.
+    
+    Figura nie jest odsyłana do procesu głównego - wynikiem jest zapisany plik.
+    
+    Parametry:
+    visualize (callable): Funkcja rysująca (np. visualize_comparison)
+    *args: Argumenty przekazywane do funkcji rysującej
+    """
+    visualize(*args)
+
+def _format_scenario_report(r, idx, label):
+    """
+    Formatuje sekcję raportu dla pojedynczego scenariusza.
+    
+    Parametry:
+    r (ScenarioResults): Wyniki analizy scenariusza
+    idx (int): Numer sekcji w raporcie
+    label (str): Opis scenariusza (np. "WYSOKIEJ ROZDZIELCZOŚCI (1 m/px)")
+    
+    Zwraca:
+    str: Sekcja raportu zakończona pustą linią
+    """
+    return REPORT_TEMPLATE.format(r=r, idx=idx, label=label, altitude_km=r.altitude/1000)
+
 # Główna funkcja wykonująca wszystkie obliczenia
 def main():
     # SCENARIUSZ 1: Wysoka rozdzielczość (1 m/px)
@@ -515,90 +865,60 @@ def main():
         "ltan": "10:30"                   # zgodnie z kamieniem milowym
     }
     
-    # Analiza scenariuszy
-    high_res_results = analyze_resolution_scenario(**high_res_params)
-    low_res_results = analyze_resolution_scenario(**low_res_params)
-    sso_results = analyze_resolution_scenario(**sso_params)
-    
-    # Wizualizacja porównania ilości danych
-    data_fig = visualize_comparison(high_res_results, low_res_results, sso_results)
-    
-    # Wizualizacja porównania interwałów obrazowania
-    intervals_fig = visualize_imaging_intervals(
-        high_res_results["imaging_intervals"], 
-        low_res_results["imaging_intervals"],
-        sso_results["imaging_intervals"]
+    # Analiza scenariuszy - jednym przebiegiem NumPy na tablicach parametrów (SoA)
+    scenario_params = [high_res_params, low_res_params, sso_params]
+    batch = analyze_resolution_scenarios_batch(
+        np.array([p["resolution"] for p in scenario_params]),
+        np.array([p["altitude"] for p in scenario_params]),
+        np.array([p["fov_degrees"] for p in scenario_params]),
+        np.array([p["sensor_width_mm"] for p in scenario_params]),
+        np.array([p["sensor_height_mm"] for p in scenario_params]),
+        np.array([p["pixel_size_um"] for p in scenario_params]),
+        np.array([p["num_channels"] for p in scenario_params]),
+        overlap_percent=np.array([p.get("overlap_percent", 10) for p in scenario_params]),
+        orbital_period_minutes=np.array([p.get("orbital_period_minutes", 90) for p in scenario_params]),
+        inclination_degrees=np.array([p["inclination_degrees"] for p in scenario_params])
+    )
+    high_res_results, low_res_results, sso_results = (
+        _scenario_from_batch(batch, i, p) for i, p in enumerate(scenario_params)
     )
     
-    # Wizualizacja orbit SSO dla wszystkich trzech scenariuszy
-    high_res_orbit_fig = visualize_sso_orbits(high_res_results)
-    low_res_orbit_fig = visualize_sso_orbits(low_res_results)
-    sso_orbit_fig = visualize_sso_orbits(sso_results)
-    
-    # Wydrukowanie podsumowania w formie raportu
-    print("RAPORT Z ANALIZY PARAMETRÓW OBRAZOWANIA SATELITARNEGO\n")
-    print(f"1. SCENARIUSZ WYSOKIEJ ROZDZIELCZOŚCI (1 m/px) - SATELITA: {high_res_results['satellite_model']}")
-    print(f"   Wysokość orbity: {high_res_results['altitude']/1000:.0f} km")
-    print(f"   Typ orbity: Heliosynchroniczna (SSO)")
-    print(f"   Inklinacja: {high_res_results['inclination_degrees']}°")
-    print(f"   LTAN: {high_res_results['ltan']}")
-    print(f"   Rozmiar pojedynczego obrazu: {high_res_results['image_size_mb']:.2f} MB")
-    print(f"   Pokrycie terenu (szerokość x wysokość): {high_res_results['swath_width_km']:.2f} x {high_res_results['swath_height_km']:.2f} km")
-    print(f"   Wymiary obrazu: {high_res_results['image_width_px']} x {high_res_results['image_height_px']} pikseli")
-    print(f"   Liczba kanałów spektralnych: {high_res_results['num_channels']}")
-    print(f"   Liczba zdjęć na pokrycie całej Ziemi: {high_res_results['num_images']:,}")
-    print(f"   Całkowita ilość danych: {high_res_results['total_data_tb']:.2f} TB")
-    print(f"   Interwał czasowy między zdjęciami: {high_res_results['imaging_intervals']['time_interval_seconds']:.2f} s")
-    print(f"   Czas na pełne pokrycie Ziemi: {high_res_results['imaging_intervals']['time_for_full_coverage_hours']:.2f} godzin")
-    print(f"   Okres orbitalny: {high_res_results['orbital_period_minutes']:.2f} minut")
-    print(f"   Liczba orbit na dzień: {high_res_results['sso_params']['orbits_per_day']:.2f}")
-    print()
-    
-    print(f"2. SCENARIUSZ NISKIEJ ROZDZIELCZOŚCI (250 m/px) - SATELITA: {low_res_results['satellite_model']}")
-    print(f"   Wysokość orbity: {low_res_results['altitude']/1000:.0f} km")
-    print(f"   Typ orbity: Heliosynchroniczna (SSO)")
-    print(f"   Inklinacja: {low_res_results['inclination_degrees']}°")
-    print(f"   LTAN: {low_res_results['ltan']}")
-    print(f"   Rozmiar pojedynczego obrazu: {low_res_results['image_size_mb']:.2f} MB")
-    print(f"   Pokrycie terenu (szerokość x wysokość): {low_res_results['swath_width_km']:.2f} x {low_res_results['swath_height_km']:.2f} km")
-    print(f"   Wymiary obrazu: {low_res_results['image_width_px']} x {low_res_results['image_height_px']} pikseli")
-    print(f"   Liczba kanałów spektralnych: {low_res_results['num_channels']}")
-    print(f"   Liczba zdjęć na pokrycie całej Ziemi: {low_res_results['num_images']:,}")
-    print(f"   Całkowita ilość danych: {low_res_results['total_data_tb']:.2f} TB")
-    print(f"   Interwał czasowy między zdjęciami: {low_res_results['imaging_intervals']['time_interval_seconds']:.2f} s")
-    print(f"   Czas na pełne pokrycie Ziemi: {low_res_results['imaging_intervals']['time_for_full_coverage_hours']:.2f} godzin")
-    print(f"   Okres orbitalny: {low_res_results['orbital_period_minutes']:.2f} minut")
-    print(f"   Liczba orbit na dzień: {low_res_results['sso_params']['orbits_per_day']:.2f}")
-    print()
-    
-    print(f"3. SCENARIUSZ ORBITY SSO (10 m/px) - SATELITA: {sso_results['satellite_model']}")
-    print(f"   Wysokość orbity: {sso_results['altitude']/1000:.0f} km")
-    print(f"   Typ orbity: Heliosynchroniczna (SSO)")
-    print(f"   Inklinacja: {sso_results['inclination_degrees']}°")
-    print(f"   LTAN: {sso_results['ltan']}")
-    print(f"   Rozmiar pojedynczego obrazu: {sso_results['image_size_mb']:.2f} MB")
-    print(f"   Pokrycie terenu (szerokość x wysokość): {sso_results['swath_width_km']:.2f} x {sso_results['swath_height_km']:.2f} km")
-    print(f"   Wymiary obrazu: {sso_results['image_width_px']} x {sso_results['image_height_px']} pikseli")
-    print(f"   Liczba kanałów spektralnych: {sso_results['num_channels']}")
-    print(f"   Liczba zdjęć na pokrycie całej Ziemi: {sso_results['num_images']:,}")
-    print(f"   Całkowita ilość danych: {sso_results['total_data_tb']:.2f} TB")
-    print(f"   Interwał czasowy między zdjęciami: {sso_results['imaging_intervals']['time_interval_seconds']:.2f} s")
-    print(f"   Czas na pełne pokrycie Ziemi: {sso_results['imaging_intervals']['time_for_full_coverage_hours']:.2f} godzin")
-    print(f"   Okres orbitalny: {sso_results['orbital_period_minutes']:.2f} minut")
-    print(f"   Liczba orbit na dzień: {sso_results['sso_params']['orbits_per_day']:.2f}")
-    print()
-    
-    print("PODSUMOWANIE I WNIOSKI:")
-    print(f"1. Satelita wysokiej rozdzielczości ({high_res_results['resolution']} m/px) generuje {high_res_results['total_data_tb']:.2f} TB danych dziennie.")
-    print(f"2. Satelita niskiej rozdzielczości ({low_res_results['resolution']} m/px) generuje {low_res_results['total_data_tb']:.2f} TB danych dziennie.")
-    print(f"3. Satelita na orbicie SSO ({sso_results['resolution']} m/px) generuje {sso_results['total_data_tb']:.2f} TB danych dziennie.")
-    print(f"4. Stosunek ilości danych wysokiej do niskiej rozdzielczości: {high_res_results['total_data_tb']/low_res_results['total_data_tb']:.2f}x")
-    print(f"5. Dla pełnego pokrycia Ziemi potrzeba odpowiednio: {high_res_results['imaging_intervals']['time_for_full_coverage_hours']:.2f}, {low_res_results['imaging_intervals']['time_for_full_coverage_hours']:.2f} i {sso_results['imaging_intervals']['time_for_full_coverage_hours']:.2f} godzin.")
-    
-    print("\nWygenerowane wykresy zostały zapisane jako:")
-    print("- porownanie_ilosci_danych.png")
-    print("- interwaly_obrazowania.png")
-    print("- wizualizacja_orbity_sso.png")
+    # Wykresy są od siebie niezależne - rysujemy je równolegle w osobnych procesach
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        futures = [
+            # Wizualizacja porównania ilości danych
+            executor.submit(_render_figures, visualize_comparison,
+                            high_res_results, low_res_results, sso_results),
+            # Wizualizacja porównania interwałów obrazowania
+            executor.submit(_render_figures, visualize_imaging_intervals,
+                            high_res_results.imaging_intervals,
+                            low_res_results.imaging_intervals,
+                            sso_results.imaging_intervals),
+            # Wizualizacja orbity SSO - wszystkie scenariusze zapisują do tego samego pliku,
+            # więc rysujemy tylko ten, który i tak zostawał na dysku (scenariusz SSO)
+            executor.submit(_render_figures, visualize_sso_orbits, sso_results)
+        ]
+        for future in futures:
+            future.result()
+    
+    # Wydrukowanie podsumowania w formie raportu - cały raport jednym zapisem na stdout
+    report = [
+        "RAPORT Z ANALIZY PARAMETRÓW OBRAZOWANIA SATELITARNEGO\n\n",
+        _format_scenario_report(high_res_results, 1, "WYSOKIEJ ROZDZIELCZOŚCI (1 m/px)"),
+        _format_scenario_report(low_res_results, 2, "NISKIEJ ROZDZIELCZOŚCI (250 m/px)"),
+        _format_scenario_report(sso_results, 3, "ORBITY SSO (10 m/px)"),
+        "PODSUMOWANIE I WNIOSKI:\n",
+        f"1. Satelita wysokiej rozdzielczości ({high_res_results.resolution} m/px) generuje {high_res_results.total_data_tb:.2f} TB danych dziennie.\n",
+        f"2. Satelita niskiej rozdzielczości ({low_res_results.resolution} m/px) generuje {low_res_results.total_data_tb:.2f} TB danych dziennie.\n",
+        f"3. Satelita na orbicie SSO ({sso_results.resolution} m/px) generuje {sso_results.total_data_tb:.2f} TB danych dziennie.\n",
+        f"4. Stosunek ilości danych wysokiej do niskiej rozdzielczości: {high_res_results.total_data_tb/low_res_results.total_data_tb:.2f}x\n",
+        f"5. Dla pełnego pokrycia Ziemi potrzeba odpowiednio: {high_res_results.imaging_intervals.time_for_full_coverage_hours:.2f}, {low_res_results.imaging_intervals.time_for_full_coverage_hours:.2f} i {sso_results.imaging_intervals.time_for_full_coverage_hours:.2f} godzin.\n",
+        "\nWygenerowane wykresy zostały zapisane jako:\n",
+        "- porownanie_ilosci_danych.png\n",
+        "- interwaly_obrazowania.png\n",
+        "- wizualizacja_orbity_sso.png\n"
+    ]
+    sys.stdout.write("".join(report))
     
     # Dodanie wywołania funkcji main() na końcu pliku
 if __name__ == "__main__":